@@ -1,136 +1,479 @@
 #!/usr/bin/env python3
 """
 Simple Azure DevOps MCP Server - Fast and Direct
-No complex auth checking, just tries to run commands directly.
+Uses the Azure CLI only to get an access token, then calls the
+Azure DevOps REST API directly over a pooled HTTPS connection.
 """
 
 import os
-import yaml
+import sys
+import base64
+import shutil
+import signal
+import subprocess
+import asyncio
+import importlib.util
 import json
 import datetime
 import logging
-import subprocess
 import re
-from typing import Optional, Dict, List, Any
+import time
+from urllib.parse import quote
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Mapping, Tuple, Union, Callable
+import httpx
 from fastmcp import FastMCP
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging - always to stderr, stdout carries the MCP stdio protocol
+logging.basicConfig(stream=sys.stderr, level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Base directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
 
+# Upper bound on in-flight trigger requests in bb7_trigger_bulk (respects ADO rate limits)
+MAX_PARALLEL_TRIGGERS = 16
+
+# Azure DevOps REST settings
+ADO_BASE_URL = "https://dev.azure.com"
+ADO_API_VERSION = "7.1"
+ADO_RESOURCE_ID = "499b84ac-1321-427f-aa17-267ca6975798"  # Azure DevOps app ID for access tokens
+TOKEN_REFRESH_MARGIN = 60  # Refresh tokens this many seconds before they expire
+
+# Azure CLI executable - resolved once at startup rather than on every command
+AZ_WINDOWS_PATH = r"C:\Program Files (x86)\Microsoft SDKs\Azure\CLI2\wbin\az.cmd"
+
+def _find_az_path() -> str:
+    """Locate the Azure CLI with filesystem checks only - no `az --version` subprocess"""
+    # Explicit override, for installs in non-standard locations
+    configured = os.getenv("AZ_CLI_PATH")
+    if configured:
+        return configured
+    
+    if os.path.isfile(AZ_WINDOWS_PATH) and os.access(AZ_WINDOWS_PATH, os.X_OK):
+        return AZ_WINDOWS_PATH
+    # shutil.which honours PATHEXT, so this also finds az.cmd on Windows
+    return shutil.which("az") or "az"
+
+AZ_PATH = _find_az_path()
+AZ_COMMAND_TIMEOUT = 5  # Seconds before an az run is killed
+
+# Access token persisted across restarts, since stdio MCP servers restart often.
+# Invalidated when the Azure CLI profile changes (az login / az logout / az account set).
+STATE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "ado-mcp", "state.json")
+AZ_PROFILE_PATH = os.path.join(
+    os.getenv("AZURE_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".azure"),
+    "azureProfile.json"
+)
+
+AUTH_SUGGESTION = "Run 'az login' to refresh your Azure CLI session"
+PAT_SUGGESTION = "Check that AZURE_DEVOPS_EXT_PAT holds a valid, unexpired PAT with Build (read & execute) scope"
+
+# Personal access token, if set - when present the Azure CLI is never invoked
+_PAT = os.getenv("AZURE_DEVOPS_EXT_PAT") or os.getenv("AZURE_DEVOPS_PAT")
+_PAT_AUTH_HEADER = "Basic " + base64.b64encode(f":{_PAT}".encode()).decode() if _PAT else None
+
+# Retries for requests throttled with HTTP 429
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0  # Seconds before the first retry, doubled after each one
+MAX_RETRY_DELAY = 30.0
+
+# Idle connections are kept this long; tool calls arrive seconds apart, and httpx's
+# 5 second default would drop the connection (and pay a new TLS handshake) in between
+KEEPALIVE_EXPIRY = 120
+
+# One pooled async client for every REST call, so repeated calls reuse the keep-alive
+# connection; with `h2` installed, concurrent requests share one HTTP/2 connection
+_http = httpx.AsyncClient(
+    timeout=10,
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(
+        max_connections=MAX_PARALLEL_TRIGGERS,
+        max_keepalive_connections=MAX_PARALLEL_TRIGGERS,
+        keepalive_expiry=KEEPALIVE_EXPIRY
+    )
+)
+
+# JSON helpers - implementation picked once at import: orjson when installed, stdlib json otherwise
+_json_loads: Callable[[Union[str, bytes]], Any]
+_json_dumps: Callable[[Any], bytes]
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize to compact JSON bytes, matching orjson's output"""
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+# Parsed config, keyed on (path, mtime_ns, size) so edits to config.yaml are picked up -
+# size catches quick rewrites on filesystems with coarse mtime resolution
+_config_cache: Dict[Tuple[str, int, int], Mapping[str, Mapping[str, Any]]] = {}
+
+def _add_rest_urls(pipeline: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute the REST URLs a pipeline needs so tool calls don't rebuild them"""
+    if all(key in pipeline for key in ("organization", "project", "pipelineID")):
+        base = f"{ADO_BASE_URL}/{quote(pipeline['organization'])}/{quote(pipeline['project'])}/_apis"
+        pipeline["_runs_url"] = f"{base}/pipelines/{pipeline['pipelineID']}/runs"
+        pipeline["_builds_url"] = f"{base}/build/builds"
+    return pipeline
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 # Simple config loader
-def load_pipelines() -> Dict[str, Dict[str, Any]]:
-    """Load pipelines from config.yaml"""
+def load_pipelines() -> Mapping[str, Mapping[str, Any]]:
+    """Load pipelines from config.yaml, reparsing only when the file changes"""
     try:
+        st = os.stat(CONFIG_PATH)
+        key = (CONFIG_PATH, st.st_mtime_ns, st.st_size)
+        cached = _config_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Imported here so server startup doesn't pay for PyYAML before it's needed
+        import yaml
+        
+        # Prefer the libyaml-backed loader; fall back to the pure-Python one
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        return {p["name"]: p for p in data.get("pipelines", [])}
+            data = yaml.load(f, Loader=loader)
+        # Frozen all the way down so callers can't mutate the shared cached config
+        # (no deepcopy needed on reads)
+        pipelines = MappingProxyType({
+            p["name"]: _freeze(_add_rest_urls(p)) for p in data.get("pipelines", [])
+        })
+
+        _config_cache.clear()
+        _config_cache[key] = pipelines
+        return pipelines
     except Exception as e:
-        logger.error(f"Failed to load config: {e}")
+        logger.error("Failed to load config: %s", e)
         return {}
 
+# Common abbreviations, compiled once
+_ABBREVIATIONS = [
+    (re.compile(r'^int'), 'integration'),  # "int" -> "integration"
+    (re.compile(r'^deploy'), 'deploy'),
+    (re.compile(r'^test'), 'test'),
+    (re.compile(r'^build'), 'build')
+]
+
+# Lowercased name index for the most recently searched pipelines mapping
+_name_index_cache: Tuple[Optional[Mapping[str, Mapping[str, Any]]], Dict[str, Mapping[str, Any]]] = (None, {})
+
+def _lowercase_index(pipelines: Mapping[str, Mapping[str, Any]]) -> Dict[str, Mapping[str, Any]]:
+    """Map lowercased pipeline names to configs, rebuilt only when the mapping changes"""
+    global _name_index_cache
+    indexed, index = _name_index_cache
+    if indexed is not pipelines:
+        index = {}
+        for name, config in pipelines.items():
+            # First one wins, like the old exact-match loop
+            index.setdefault(name.lower(), config)
+        _name_index_cache = (pipelines, index)
+    return index
+
 # Simple pipeline finder using regex
-def find_pipeline(query: str, pipelines: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def find_pipeline(query: str, pipelines: Mapping[str, Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
     """Find pipeline using simple string matching"""
     query_lower = query.lower().strip()
+    index = _lowercase_index(pipelines)
     
     # Try exact match first
-    for name, config in pipelines.items():
-        if name.lower() == query_lower:
-            return config
+    config = index.get(query_lower)
+    if config is not None:
+        return config
     
     # Try partial match
-    for name, config in pipelines.items():
-        if query_lower in name.lower():
-            return config
+    config = next((c for name, c in index.items() if query_lower in name), None)
+    if config is not None:
+        return config
     
     # Try regex pattern matching for common abbreviations
-    patterns = [
-        (r'^int', 'integration'),  # "int" -> "integration"
-        (r'^deploy', 'deploy'),
-        (r'^test', 'test'),
-        (r'^build', 'build')
-    ]
-    
-    for pattern, replacement in patterns:
-        if re.match(pattern, query_lower):
-            for name, config in pipelines.items():
-                if replacement in name.lower():
-                    return config
+    for pattern, replacement in _ABBREVIATIONS:
+        if pattern.match(query_lower):
+            config = next((c for name, c in index.items() if replacement in name), None)
+            if config is not None:
+                return config
     
     return None
 
+# Azure CLI error text that points at a missing or expired login
+_AUTH_ERROR_RE = re.compile(r'login|authenticate|credential|unauthorized', re.IGNORECASE)
+
+def _kill_process_tree(pid: int) -> None:
+    """Kill a process and its children - az is a wrapper script whose Python child
+    holds the output pipes open, so killing only the wrapper leaves the call hanging"""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/T", "/F", "/PID", str(pid)], capture_output=True, timeout=AZ_COMMAND_TIMEOUT)
+        else:
+            os.killpg(pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning("Could not kill az process tree %s: %s", pid, e)
+
 # Simple Azure CLI runner
-def run_az_direct(command: List[str]) -> Dict[str, Any]:
+async def run_az_direct(command: List[str]) -> Dict[str, Any]:
     """Run Azure CLI command directly, try auth if it fails"""
     
-    # Try common az.cmd path first
-    az_path = r"C:\Program Files (x86)\Microsoft SDKs\Azure\CLI2\wbin\az.cmd"
-    if not os.path.exists(az_path):
-        az_path = "az"  # Try PATH
-    
     if command[0] == "az":
-        command[0] = az_path
+        command[0] = AZ_PATH
     
     try:
-        print(f"Executing Azure CLI command: {' '.join(command)}")
-        logger.info(f"Running: {' '.join(command)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running: %s", " ".join(command))
         
         # Add environment variables to prevent interactive prompts
         env = os.environ.copy()
         env['AZURE_CORE_NO_COLOR'] = '1'
         env['AZURE_CORE_ONLY_SHOW_ERRORS'] = 'true'
         
-        print(f"Starting command execution with 5 second timeout...")
-        result = subprocess.run(
-            command, 
-            capture_output=True, 
-            text=True, 
-            timeout=5,  # Even shorter timeout
-            check=False,
+        # Async subprocess so other tool calls keep running while az starts up
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.DEVNULL,  # Prevent any stdin interaction
             env=env,
-            stdin=subprocess.DEVNULL  # Prevent any stdin interaction
+            start_new_session=True  # Own process group, so a timeout can kill az's children too
         )
-        print(f"Command completed with return code: {result.returncode}")
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(process.communicate(), timeout=AZ_COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            _kill_process_tree(process.pid)
+            await process.wait()
+            raise
+        stdout = stdout_bytes.decode("utf-8", errors="replace")
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
+        logger.debug("Command completed with return code: %s", process.returncode)
         
-        if result.returncode == 0:
-            try:
-                data = json.loads(result.stdout) if result.stdout.strip() else {}
-                return {"success": True, "data": data}
-            except json.JSONDecodeError:
-                return {"success": True, "data": {"output": result.stdout}}
+        if process.returncode == 0:
+            output = stdout.strip()
+            if not output:
+                return {"success": True, "data": {}}
+            
+            # Only hand JSON-looking output to the parser; plain text skips the failed parse
+            if output[0] in '{["':
+                try:
+                    return {"success": True, "data": _json_loads(output)}
+                except json.JSONDecodeError:
+                    pass
+            return {"success": True, "data": {"output": stdout}}
         else:
-            error = result.stderr.strip() or result.stdout.strip()
+            error = stderr.strip() or stdout.strip()
             
             # If auth error, suggest login
-            if any(keyword in error.lower() for keyword in ['login', 'authenticate', 'credential', 'unauthorized']):
+            if _AUTH_ERROR_RE.search(error):
                 return {
                     "success": False,
                     "error": error,
-                    "suggestion": "Run 'az login' and 'az extension add --name azure-devops' if needed"
+                    "suggestion": AUTH_SUGGESTION
                 }
             
             return {"success": False, "error": error}
             
-    except subprocess.TimeoutExpired:
-        print("Command timed out after 5 seconds")
-        return {"success": False, "error": "Command timed out after 5 seconds"}
+    except asyncio.TimeoutError:
+        logger.error("Command timed out after %s seconds", AZ_COMMAND_TIMEOUT)
+        return {"success": False, "error": f"Command timed out after {AZ_COMMAND_TIMEOUT} seconds"}
     except Exception as e:
-        print(f"Exception occurred: {str(e)}")
+        logger.error("Azure CLI command failed: %s", e)
         return {"success": False, "error": str(e)}
 
+# Access token from the Azure CLI, reused until shortly before it expires
+_token_cache: Dict[str, Any] = {}
+# Serializes refreshes so concurrent tool calls share one `az` run; created on first
+# use because on Python 3.9 a Lock binds to the loop that exists when it's created
+_token_lock: Optional[asyncio.Lock] = None
+
+def _token_expiry(data: Dict[str, Any]) -> float:
+    """Get the expiry (epoch seconds) of an `az account get-access-token` result"""
+    if "expires_on" in data:
+        return float(data["expires_on"])
+    
+    # Older CLI versions only report a local-time string
+    try:
+        return datetime.datetime.strptime(data["expiresOn"], "%Y-%m-%d %H:%M:%S.%f").timestamp()
+    except (KeyError, ValueError):
+        return time.time() + 300
+
+def _profile_mtime() -> Optional[int]:
+    """Get the mtime of the Azure CLI profile, which changes on login/logout"""
+    try:
+        return os.stat(AZ_PROFILE_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+def _load_token_state() -> None:
+    """Populate the token cache from disk if the saved token is still usable"""
+    try:
+        with open(STATE_PATH, "rb") as f:
+            state = _json_loads(f.read())
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError):
+        _clear_token_state()
+        return
+    
+    # Anything malformed is dropped, so a bad file can't break every later call
+    if not (isinstance(state, dict)
+            and isinstance(state.get("token"), str)
+            and isinstance(state.get("expires_on"), (int, float))
+            and not isinstance(state["expires_on"], bool)):
+        _clear_token_state()
+        return
+    
+    if state.get("profile_mtime") == _profile_mtime():
+        _token_cache["token"] = state["token"]
+        _token_cache["expires_on"] = state["expires_on"]
+
+def _save_token_state() -> None:
+    """Persist the token cache to disk, readable only by the current user"""
+    state = {**_token_cache, "profile_mtime": _profile_mtime()}
+    tmp_path = STATE_PATH + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+        # os.open's mode only applies on creation, so a leftover temp file could keep wider permissions
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_json_dumps(state))
+        os.replace(tmp_path, STATE_PATH)
+    except OSError as e:
+        logger.warning("Could not save token state to %s: %s", STATE_PATH, e)
+
+def _clear_token_state() -> None:
+    """Forget the cached token, both in memory and on disk"""
+    _token_cache.clear()
+    try:
+        os.remove(STATE_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Could not remove token state %s: %s", STATE_PATH, e)
+
+async def get_access_token() -> Dict[str, Any]:
+    """Get an Azure DevOps bearer token via the Azure CLI, cached until it expires"""
+    global _token_lock
+    if _token_lock is None:
+        _token_lock = asyncio.Lock()
+    
+    async with _token_lock:
+        if not _token_cache:
+            _load_token_state()
+        
+        if _token_cache and time.time() < _token_cache["expires_on"] - TOKEN_REFRESH_MARGIN:
+            return {"success": True, "token": _token_cache["token"]}
+        
+        result = await run_az_direct([
+            "az", "account", "get-access-token",
+            "--resource", ADO_RESOURCE_ID,
+            "--output", "json"
+        ])
+        if not result["success"]:
+            return result
+        
+        token = result["data"].get("accessToken")
+        if not token:
+            return {"success": False, "error": "Azure CLI did not return an access token", "suggestion": AUTH_SUGGESTION}
+        
+        _token_cache["token"] = token
+        _token_cache["expires_on"] = _token_expiry(result["data"])
+        _save_token_state()
+        return {"success": True, "token": token}
+
+async def get_auth_header() -> Dict[str, Any]:
+    """Get the Authorization header value: the PAT if configured, otherwise an Azure CLI token"""
+    if _PAT_AUTH_HEADER:
+        return {"success": True, "header": _PAT_AUTH_HEADER}
+    
+    auth = await get_access_token()
+    if not auth["success"]:
+        return auth
+    return {"success": True, "header": f"Bearer {auth['token']}"}
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled request: Retry-After, else exponential backoff"""
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+    return min(delay, MAX_RETRY_DELAY)
+
+# Simple Azure DevOps REST runner
+async def run_ado_rest(method: str, url: str, auth_header: str, params: Optional[Dict[str, Any]] = None,
+                       body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Call the Azure DevOps REST API, returning the same shape as run_az_direct"""
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            response = await _http.request(
+                method,
+                url,
+                params={**(params or {}), "api-version": ADO_API_VERSION},
+                json=body,
+                headers={"Authorization": auth_header}
+            )
+        except httpx.HTTPError as e:
+            logger.error("Request to %s failed: %s", url, e)
+            return {"success": False, "error": str(e)}
+        
+        # Throttled requests were not processed, so retrying (even a POST) is safe
+        if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+            break
+        delay = _retry_delay(response, attempt)
+        logger.warning("Throttled by Azure DevOps, retrying in %.1f seconds", delay)
+        await asyncio.sleep(delay)
+    
+    # Azure DevOps answers bad credentials with 401, or 203 and a sign-in page
+    if response.status_code in (401, 203):
+        if _PAT_AUTH_HEADER:
+            suggestion = PAT_SUGGESTION
+        else:
+            _clear_token_state()
+            suggestion = AUTH_SUGGESTION
+        return {
+            "success": False,
+            "error": f"Azure DevOps rejected the credentials (HTTP {response.status_code})",
+            "suggestion": suggestion
+        }
+    
+    if response.is_error:
+        return {"success": False, "error": f"HTTP {response.status_code}: {response.text.strip()}"}
+    
+    try:
+        data = _json_loads(response.content) if response.content else {}
+    except json.JSONDecodeError:
+        return {"success": False, "error": f"Unexpected non-JSON response from {url}"}
+    return {"success": True, "data": data}
+
+def _incomplete_config_error(pipeline: Mapping[str, Any]) -> str:
+    """Error for a pipeline whose REST URLs couldn't be built from config.yaml"""
+    return f"Pipeline '{pipeline.get('name')}' is missing organization/project/pipelineID in config.yaml"
+
 # Initialize MCP server
-mcp = FastMCP(name="ado-simple", version="1.0.0", dependencies=["PyYAML"])
+mcp = FastMCP(name="ado-simple", version="1.0.0", dependencies=["PyYAML", "httpx"])
 
 @mcp.tool(
     name="bb7_trigger_bulk",
     description="Trigger pipeline multiple times. Use pipeline name or abbreviation (e.g. 'int' for integration)."
 )
-def bb7_trigger_bulk(name: str, count: int, branch: Optional[str] = None) -> List[Dict[str, Any]]:
+async def bb7_trigger_bulk(name: str, count: int, branch: Optional[str] = None) -> List[Dict[str, Any]]:
     """Trigger pipeline runs directly"""
     
     # Load pipelines
@@ -147,52 +490,59 @@ def bb7_trigger_bulk(name: str, count: int, branch: Optional[str] = None) -> Lis
             "available": available
         }]
     
+    if "_runs_url" not in pipeline:
+        return [{"success": False, "error": _incomplete_config_error(pipeline)}]
+    
     # Determine branch
     target_branch = branch or pipeline.get("branch", "main")
     
-    results = []
-    for i in range(count):
-        command = [
-            "az", "pipelines", "run",
-            "--organization", f"https://dev.azure.com/{pipeline['organization']}",
-            "--project", pipeline["project"],
-            "--id", str(pipeline["pipelineID"]),
-            "--branch", target_branch,
-            "--output", "json"
-        ]
-        
-        result = run_az_direct(command)
+    auth = await get_auth_header()
+    if not auth["success"]:
+        return [{"success": False, "error": auth["error"], "suggestion": auth.get("suggestion")}]
+    
+    ref_name = target_branch if target_branch.startswith("refs/") else f"refs/heads/{target_branch}"
+    body = {"resources": {"repositories": {"self": {"refName": ref_name}}}}
+    
+    # Each trigger is an independent network round-trip, so fire them concurrently
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_TRIGGERS)
+    auth_failed = asyncio.Event()
+    
+    async def trigger_once(i: int) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            # Stop on auth errors - skip runs that haven't started yet
+            if auth_failed.is_set():
+                return None
+            result = await run_ado_rest("POST", pipeline["_runs_url"], auth["header"], body=body)
         
         if result["success"]:
             run_data = result["data"]
-            results.append({
+            return {
                 "success": True,
                 "run_number": i + 1,
                 "pipeline_name": name,
                 "branch": target_branch,
                 "run_id": run_data.get("id"),
                 "url": run_data.get("url")
-            })
-        else:
-            results.append({
-                "success": False,
-                "run_number": i + 1,
-                "error": result["error"],
-                "suggestion": result.get("suggestion")
-            })
-            
-            # Stop on auth errors
-            if result.get("suggestion"):
-                break
+            }
+        
+        if result.get("suggestion"):
+            auth_failed.set()
+        return {
+            "success": False,
+            "run_number": i + 1,
+            "error": result["error"],
+            "suggestion": result.get("suggestion")
+        }
     
-    return results
+    results = await asyncio.gather(*(trigger_once(i) for i in range(count)))
+    return [r for r in results if r is not None]
 
 @mcp.tool(
     name="bb7_list_runs",
-    description="List recent pipeline runs"
+    description="List recent pipeline runs. Pass `fields` (e.g. ['id', 'status', 'result']) to return only those keys per run."
 )
-def bb7_list_runs(name: str, top: int = 10) -> Dict[str, Any]:
-    """List pipeline runs"""
+async def bb7_list_runs(name: str, top: int = 10, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """List pipeline runs, optionally trimmed to the requested fields"""
     
     pipelines = load_pipelines()
     pipeline = find_pipeline(name, pipelines)
@@ -200,23 +550,32 @@ def bb7_list_runs(name: str, top: int = 10) -> Dict[str, Any]:
     if not pipeline:
         return {"error": f"Pipeline '{name}' not found", "available": get_pipeline_names()}
     
-    command = [
-        "az", "pipelines", "runs", "list",
-        "--organization", f"https://dev.azure.com/{pipeline['organization']}",
-        "--project", pipeline["project"],
-        "--pipeline-ids", str(pipeline["pipelineID"]),
-        "--top", str(top),
-        "--output", "json"
-    ]
+    if "_builds_url" not in pipeline:
+        return {"success": False, "error": _incomplete_config_error(pipeline)}
+    
+    auth = await get_auth_header()
+    if not auth["success"]:
+        return {"success": False, "error": auth["error"], "suggestion": auth.get("suggestion")}
     
-    result = run_az_direct(command)
+    # Same Build API `az pipelines runs list` uses, so runs keep the same shape
+    result = await run_ado_rest("GET", pipeline["_builds_url"], auth["header"], params={
+        "definitions": pipeline["pipelineID"],
+        "$top": top,
+        "queryOrder": "queueTimeDescending"
+    })
     
     if result["success"]:
+        runs = result["data"].get("value", [])
+        
+        # Full build records are several KB each; send back only what was asked for
+        if fields:
+            runs = [{field: run.get(field) for field in fields} for run in runs]
+        
         return {
             "success": True,
             "pipeline": name,
-            "runs": result["data"],
-            "count": len(result["data"]) if isinstance(result["data"], list) else 0
+            "runs": runs,
+            "count": len(runs)
         }
     else:
         return {
@@ -234,25 +593,29 @@ def list_pipelines_simple() -> None:
         print("No pipelines configured")
         return
     
-    print(f"Available pipelines ({len(pipelines)} total):")
-    print("-" * 50)
+    # Build the listing first and write it once, rather than one print per line
+    lines = [f"Available pipelines ({len(pipelines)} total):", "-" * 50]
     
     for name, config in pipelines.items():
-        print(f"Name: {name}")
-        print(f"  Organization: {config.get('organization', 'N/A')}")
-        print(f"  Project: {config.get('project', 'N/A')}")
-        print(f"  Pipeline ID: {config.get('pipelineID', 'N/A')}")
-        print(f"  Branch: {config.get('branch', 'N/A')}")
-        print()
+        lines += [
+            f"Name: {name}",
+            f"  Organization: {config.get('organization', 'N/A')}",
+            f"  Project: {config.get('project', 'N/A')}",
+            f"  Pipeline ID: {config.get('pipelineID', 'N/A')}",
+            f"  Branch: {config.get('branch', 'N/A')}",
+            ""
+        ]
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def get_pipeline_names() -> List[str]:
     """Get a simple list of pipeline names"""
+    # load_pipelines() is already cached per config.yaml version
     pipelines = load_pipelines()
     return list(pipelines.keys())
 
 if __name__ == "__main__":
     # For testing, you can call the simple functions directly
-    import sys
     if len(sys.argv) > 1 and sys.argv[1] == "--list":
         list_pipelines_simple()
     else:
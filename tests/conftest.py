@@ -0,0 +1,83 @@
+"""Shared fixtures for the server_simple tests"""
+
+import os
+import sys
+from typing import Any, Callable, Dict, List
+
+import httpx
+import pytest
+
+# server_simple.py lives at the repository root, next to this folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server_simple  # noqa: E402
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """server_simple with config, token state and Azure CLI profile redirected into tmp_path"""
+    profile = tmp_path / "azureProfile.json"
+    profile.write_text("{}")
+
+    monkeypatch.setattr(server_simple, "CONFIG_PATH", str(tmp_path / "config.yaml"))
+    monkeypatch.setattr(server_simple, "STATE_PATH", str(tmp_path / "state" / "state.json"))
+    monkeypatch.setattr(server_simple, "AZ_PROFILE_PATH", str(profile))
+    monkeypatch.setattr(server_simple, "_PAT_AUTH_HEADER", None)
+    monkeypatch.setattr(server_simple, "_token_lock", None)
+    server_simple._config_cache.clear()
+    server_simple._token_cache.clear()
+    yield server_simple
+    server_simple._config_cache.clear()
+    server_simple._token_cache.clear()
+
+
+@pytest.fixture
+def mock_http(server, monkeypatch) -> Callable[[Callable[[httpx.Request], httpx.Response]], List[httpx.Request]]:
+    """Route REST calls to a handler; returns the list of requests it received"""
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> List[httpx.Request]:
+        requests: List[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        monkeypatch.setattr(server, "_http", httpx.AsyncClient(transport=httpx.MockTransport(record)))
+        return requests
+
+    return install
+
+
+@pytest.fixture
+def no_sleep(monkeypatch) -> List[float]:
+    """Skip retry backoff sleeps; returns the delays that were requested"""
+    delays: List[float] = []
+
+    async def fake_sleep(delay: float, *args: Any, **kwargs: Any) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(server_simple.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def write_config(server) -> Callable[[List[Dict[str, Any]]], None]:
+    """Write a config.yaml holding the given pipeline entries"""
+    import yaml
+
+    def write(pipelines: List[Dict[str, Any]]) -> None:
+        with open(server.CONFIG_PATH, "w", encoding="utf-8") as f:
+            yaml.safe_dump({"pipelines": pipelines}, f)
+
+    return write
+
+
+@pytest.fixture
+def pipeline_entry() -> Dict[str, Any]:
+    """A complete config.yaml pipeline entry; the organization needs URL quoting"""
+    return {
+        "name": "CI Integration",
+        "organization": "my org",
+        "project": "Proj",
+        "pipelineID": 42,
+        "branch": "dev"
+    }
@@ -0,0 +1,46 @@
+"""Tests for locating the Azure CLI executable"""
+
+import pytest
+
+
+@pytest.fixture
+def az_lookup(server, monkeypatch):
+    """No override, no Windows install and nothing on PATH unless a test says otherwise"""
+    monkeypatch.delenv("AZ_CLI_PATH", raising=False)
+    monkeypatch.setattr(server.os.path, "isfile", lambda path: False)
+    monkeypatch.setattr(server.os, "access", lambda path, mode: True)
+    monkeypatch.setattr(server.shutil, "which", lambda name: None)
+    return server
+
+
+def test_az_path_prefers_windows_install(az_lookup, monkeypatch):
+    monkeypatch.setattr(az_lookup.os.path, "isfile", lambda path: path == az_lookup.AZ_WINDOWS_PATH)
+    monkeypatch.setattr(az_lookup.shutil, "which", lambda name: "/usr/bin/az")
+
+    assert az_lookup._find_az_path() == az_lookup.AZ_WINDOWS_PATH
+
+
+def test_az_path_skips_non_executable_windows_install(az_lookup, monkeypatch):
+    monkeypatch.setattr(az_lookup.os.path, "isfile", lambda path: path == az_lookup.AZ_WINDOWS_PATH)
+    monkeypatch.setattr(az_lookup.os, "access", lambda path, mode: False)
+    monkeypatch.setattr(az_lookup.shutil, "which", lambda name: "/usr/bin/az")
+
+    assert az_lookup._find_az_path() == "/usr/bin/az"
+
+
+def test_az_path_falls_back_to_path_search(az_lookup, monkeypatch):
+    monkeypatch.setattr(az_lookup.shutil, "which", lambda name: "/usr/bin/az" if name == "az" else None)
+
+    assert az_lookup._find_az_path() == "/usr/bin/az"
+
+
+def test_az_path_falls_back_to_bare_name(az_lookup):
+    assert az_lookup._find_az_path() == "az"
+
+
+def test_az_path_override_wins(az_lookup, monkeypatch):
+    monkeypatch.setenv("AZ_CLI_PATH", "/opt/azure-cli/bin/az")
+    monkeypatch.setattr(az_lookup.os.path, "isfile", lambda path: True)
+    monkeypatch.setattr(az_lookup.shutil, "which", lambda name: "/usr/bin/az")
+
+    assert az_lookup._find_az_path() == "/opt/azure-cli/bin/az"
@@ -0,0 +1,48 @@
+"""Tests for loading pipelines from config.yaml"""
+
+import asyncio
+import os
+
+import httpx
+
+
+def test_tools_report_incomplete_pipeline_config(server, mock_http, write_config):
+    write_config([{"name": "Broken", "project": "Proj", "pipelineID": 1}])
+    requests = mock_http(lambda request: httpx.Response(200, json={}))
+    expected = "Pipeline 'Broken' is missing organization/project/pipelineID in config.yaml"
+
+    assert asyncio.run(server.bb7_trigger_bulk.fn("broken", 2)) == [{"success": False, "error": expected}]
+    assert asyncio.run(server.bb7_list_runs.fn("broken")) == {"success": False, "error": expected}
+    assert requests == []
+
+
+def test_config_cache_reuses_parse_until_file_changes(server, write_config, pipeline_entry):
+    write_config([pipeline_entry])
+
+    first = server.load_pipelines()
+    assert server.load_pipelines() is first
+    assert list(first) == ["CI Integration"]
+
+
+def test_config_cache_invalidated_on_mtime_change(server, write_config, pipeline_entry):
+    write_config([pipeline_entry])
+    first = server.load_pipelines()
+
+    st = os.stat(server.CONFIG_PATH)
+    os.utime(server.CONFIG_PATH, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert server.load_pipelines() is not first
+
+
+def test_config_cache_invalidated_on_size_change(server, write_config, pipeline_entry):
+    write_config([pipeline_entry])
+    first = server.load_pipelines()
+    st = os.stat(server.CONFIG_PATH)
+
+    # Same mtime, as on filesystems with coarse timestamps
+    write_config([pipeline_entry, {**pipeline_entry, "name": "Second"}])
+    os.utime(server.CONFIG_PATH, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert list(server.load_pipelines()) == ["CI Integration", "Second"]
+    assert server.get_pipeline_names() == ["CI Integration", "Second"]
+    assert list(first) == ["CI Integration"]
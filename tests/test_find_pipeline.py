@@ -0,0 +1,25 @@
+"""Tests for matching a query to a configured pipeline"""
+
+
+def test_find_pipeline_exact_match_ignores_case(server):
+    pipelines = {"Deploy": {"id": 1}, "Deploy Staging": {"id": 2}}
+    assert server.find_pipeline("  deploy ", pipelines) == {"id": 1}
+
+
+def test_find_pipeline_substring_match(server):
+    pipelines = {"CI Build": {"id": 1}, "Nightly Stress": {"id": 2}}
+    assert server.find_pipeline("stress", pipelines) == {"id": 2}
+
+
+def test_find_pipeline_abbreviation_match(server):
+    pipelines = {"Smoke": {"id": 1}, "Integration Tests": {"id": 2}}
+    assert server.find_pipeline("intg", pipelines) == {"id": 2}
+
+
+def test_find_pipeline_first_wins_on_case_only_differences(server):
+    pipelines = {"Build-A": {"id": 1}, "build-a": {"id": 2}}
+    assert server.find_pipeline("BUILD-A", pipelines) == {"id": 1}
+
+
+def test_find_pipeline_no_match(server):
+    assert server.find_pipeline("missing", {"Deploy": {"id": 1}}) is None
@@ -0,0 +1,48 @@
+"""Tests for bb7_list_runs over the Build REST API"""
+
+import asyncio
+
+import httpx
+import pytest
+
+RUNS = [
+    {"id": 1, "status": "completed", "result": "succeeded", "buildNumber": "20260101.1"},
+    {"id": 2, "result": "failed"}
+]
+
+
+@pytest.fixture
+def list_runs(server, mock_http, write_config, pipeline_entry):
+    """Configure one pipeline and answer Build API queries with RUNS"""
+    write_config([pipeline_entry])
+    server._PAT_AUTH_HEADER = "Basic abc"
+    return mock_http(lambda request: httpx.Response(200, json={"count": len(RUNS), "value": RUNS}))
+
+
+def test_list_runs_queries_build_api(server, list_runs):
+    result = asyncio.run(server.bb7_list_runs.fn("integration", top=5))
+
+    assert result == {"success": True, "pipeline": "integration", "runs": RUNS, "count": 2}
+    request = list_runs[0]
+    assert request.method == "GET"
+    assert request.url.raw_path.split(b"?")[0] == b"/my%20org/Proj/_apis/build/builds"
+    assert dict(request.url.params) == {
+        "definitions": "42",
+        "$top": "5",
+        "queryOrder": "queueTimeDescending",
+        "api-version": server.ADO_API_VERSION
+    }
+
+
+def test_list_runs_trims_to_requested_fields(server, list_runs):
+    result = asyncio.run(server.bb7_list_runs.fn("integration", fields=["id", "status"]))
+
+    assert result["runs"] == [{"id": 1, "status": "completed"}, {"id": 2, "status": None}]
+    assert result["count"] == 2
+
+
+@pytest.mark.parametrize("fields", [None, []])
+def test_list_runs_returns_full_records_without_fields(server, list_runs, fields):
+    result = asyncio.run(server.bb7_list_runs.fn("integration", fields=fields))
+
+    assert result["runs"] == RUNS
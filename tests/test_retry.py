@@ -0,0 +1,38 @@
+"""Tests for retrying requests throttled with HTTP 429"""
+
+import asyncio
+
+import httpx
+
+
+def test_retry_honours_retry_after(server, mock_http, no_sleep):
+    responses = [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={"ok": True})]
+    requests = mock_http(lambda request: responses.pop(0))
+
+    result = asyncio.run(server.run_ado_rest("GET", "https://dev.azure.com/x", "Basic abc"))
+
+    assert result == {"success": True, "data": {"ok": True}}
+    assert len(requests) == 2
+    assert no_sleep == [2.0]
+
+
+def test_retry_backs_off_exponentially_without_retry_after(server, mock_http, no_sleep):
+    responses = [httpx.Response(429), httpx.Response(429), httpx.Response(200, json={})]
+    mock_http(lambda request: responses.pop(0))
+
+    result = asyncio.run(server.run_ado_rest("GET", "https://dev.azure.com/x", "Basic abc"))
+
+    assert result["success"] is True
+    assert no_sleep == [server.RATE_LIMIT_BACKOFF, server.RATE_LIMIT_BACKOFF * 2]
+
+
+def test_retry_gives_up_after_retry_limit(server, mock_http, no_sleep):
+    requests = mock_http(lambda request: httpx.Response(429, headers={"Retry-After": "100"}))
+
+    result = asyncio.run(server.run_ado_rest("GET", "https://dev.azure.com/x", "Basic abc"))
+
+    assert result["success"] is False
+    assert result["error"].startswith("HTTP 429")
+    assert len(requests) == server.RATE_LIMIT_RETRIES + 1
+    # Retry-After is capped so one response can't stall a tool call
+    assert no_sleep == [server.MAX_RETRY_DELAY] * server.RATE_LIMIT_RETRIES
@@ -0,0 +1,74 @@
+"""Tests for run_az_direct against a fake `az` executable"""
+
+import asyncio
+import os
+import stat
+import time
+from typing import Any, Callable, Dict
+
+import pytest
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake az is a POSIX shell script")
+
+
+@pytest.fixture
+def fake_az_script(server, tmp_path, monkeypatch) -> Callable[[str], None]:
+    """Install a shell script with the given body as `az`, found through AZ_CLI_PATH"""
+    def install(body: str) -> None:
+        script = tmp_path / "az"
+        script.write_text("#!/bin/sh\n" + body + "\n")
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+        monkeypatch.setenv("AZ_CLI_PATH", str(script))
+        monkeypatch.setattr(server, "AZ_PATH", server._find_az_path())
+
+    return install
+
+
+def run_az(server) -> Dict[str, Any]:
+    return asyncio.run(server.run_az_direct(["az", "account", "show"]))
+
+
+def test_run_az_parses_json_output(server, fake_az_script):
+    fake_az_script("""echo '{"user": {"name": "me"}}'""")
+    assert run_az(server) == {"success": True, "data": {"user": {"name": "me"}}}
+
+
+def test_run_az_wraps_plain_text_output(server, fake_az_script):
+    fake_az_script("echo hello")
+    assert run_az(server) == {"success": True, "data": {"output": "hello\n"}}
+
+
+def test_run_az_wraps_malformed_json_output(server, fake_az_script):
+    fake_az_script("echo '{oops'")
+    assert run_az(server) == {"success": True, "data": {"output": "{oops\n"}}
+
+
+def test_run_az_empty_output(server, fake_az_script):
+    fake_az_script("true")
+    assert run_az(server) == {"success": True, "data": {}}
+
+
+def test_run_az_auth_error_suggests_login(server, fake_az_script):
+    fake_az_script("echo \"ERROR: Please run 'az login' to setup account.\" >&2; exit 1")
+    assert run_az(server) == {
+        "success": False,
+        "error": "ERROR: Please run 'az login' to setup account.",
+        "suggestion": server.AUTH_SUGGESTION
+    }
+
+
+def test_run_az_other_error_has_no_suggestion(server, fake_az_script):
+    fake_az_script("echo 'ERROR: resource not found' >&2; exit 3")
+    assert run_az(server) == {"success": False, "error": "ERROR: resource not found"}
+
+
+def test_run_az_timeout_kills_child_processes(server, fake_az_script, monkeypatch):
+    # Like the real az wrapper: the work happens in a child that holds the output pipes open
+    fake_az_script("sleep 30 &\nwait")
+    monkeypatch.setattr(server, "AZ_COMMAND_TIMEOUT", 1)
+
+    start = time.monotonic()
+    result = run_az(server)
+
+    assert result == {"success": False, "error": "Command timed out after 1 seconds"}
+    assert time.monotonic() - start < 5
@@ -0,0 +1,76 @@
+"""Tests for the access token cache persisted across restarts"""
+
+import asyncio
+import os
+import stat
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+
+@pytest.fixture
+def fake_az(server, monkeypatch) -> List[List[str]]:
+    """Replace the Azure CLI with one that hands out a fresh token; returns the commands run"""
+    calls: List[List[str]] = []
+
+    async def run_az(command: List[str]) -> Dict[str, Any]:
+        calls.append(command)
+        return {"success": True, "data": {"accessToken": f"token-{len(calls)}", "expires_on": time.time() + 3600}}
+
+    monkeypatch.setattr(server, "run_az_direct", run_az)
+    return calls
+
+
+def test_token_state_round_trip(server, fake_az):
+    assert asyncio.run(server.get_access_token()) == {"success": True, "token": "token-1"}
+    assert stat.S_IMODE(os.stat(server.STATE_PATH).st_mode) == 0o600
+
+    # A restarted server reads the token back instead of running az again
+    server._token_cache.clear()
+    assert asyncio.run(server.get_access_token()) == {"success": True, "token": "token-1"}
+    assert len(fake_az) == 1
+
+
+def test_token_state_ignored_after_profile_change(server, fake_az):
+    asyncio.run(server.get_access_token())
+    server._token_cache.clear()
+
+    # az login / az account set rewrite the profile
+    st = os.stat(server.AZ_PROFILE_PATH)
+    os.utime(server.AZ_PROFILE_PATH, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert asyncio.run(server.get_access_token()) == {"success": True, "token": "token-2"}
+    assert len(fake_az) == 2
+
+
+def test_token_state_tmp_file_gets_owner_only_mode(server, fake_az):
+    os.makedirs(os.path.dirname(server.STATE_PATH))
+    tmp_path = server.STATE_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write("stale")
+    os.chmod(tmp_path, 0o644)
+
+    asyncio.run(server.get_access_token())
+
+    assert stat.S_IMODE(os.stat(server.STATE_PATH).st_mode) == 0o600
+
+
+@pytest.mark.parametrize("content", [
+    b'{"token": "x"}',
+    b'{"token": "x", "expires_on": "abc"}',
+    b'{"token": 1, "expires_on": 1}',
+    b'[1, 2]',
+    b'"str"',
+    b'{not json'
+])
+def test_corrupt_token_state_is_discarded(server, fake_az, content):
+    os.makedirs(os.path.dirname(server.STATE_PATH))
+    with open(server.STATE_PATH, "wb") as f:
+        f.write(content)
+
+    server._load_token_state()
+
+    assert server._token_cache == {}
+    assert not os.path.exists(server.STATE_PATH)
+    assert asyncio.run(server.get_access_token()) == {"success": True, "token": "token-1"}
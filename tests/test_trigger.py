@@ -0,0 +1,49 @@
+"""Tests for bb7_trigger_bulk over the Pipelines Runs REST API"""
+
+import asyncio
+import json
+
+import httpx
+
+
+def test_trigger_bulk_posts_run_requests(server, mock_http, write_config, pipeline_entry):
+    write_config([pipeline_entry])
+    server._PAT_AUTH_HEADER = "Basic abc"
+    requests = mock_http(lambda request: httpx.Response(200, json={"id": 7, "url": "https://run"}))
+
+    results = asyncio.run(server.bb7_trigger_bulk.fn("integration", 3))
+
+    assert len(requests) == 3
+    for request in requests:
+        assert request.method == "POST"
+        assert request.url.raw_path.split(b"?")[0] == b"/my%20org/Proj/_apis/pipelines/42/runs"
+        assert request.url.params["api-version"] == server.ADO_API_VERSION
+        assert request.headers["Authorization"] == "Basic abc"
+        assert json.loads(request.content) == {"resources": {"repositories": {"self": {"refName": "refs/heads/dev"}}}}
+    assert sorted(r["run_number"] for r in results) == [1, 2, 3]
+    assert all(r["success"] and r["run_id"] == 7 and r["branch"] == "dev" for r in results)
+
+
+def test_trigger_bulk_keeps_full_ref_names(server, mock_http, write_config, pipeline_entry):
+    write_config([pipeline_entry])
+    server._PAT_AUTH_HEADER = "Basic abc"
+    requests = mock_http(lambda request: httpx.Response(200, json={"id": 1}))
+
+    asyncio.run(server.bb7_trigger_bulk.fn("integration", 1, branch="refs/tags/v1"))
+
+    assert json.loads(requests[0].content)["resources"]["repositories"]["self"]["refName"] == "refs/tags/v1"
+
+
+def test_trigger_bulk_stops_on_auth_error(server, mock_http, write_config, pipeline_entry, monkeypatch):
+    write_config([pipeline_entry])
+    server._PAT_AUTH_HEADER = "Basic abc"
+    # One trigger at a time, so every trigger after the first sees the auth failure
+    monkeypatch.setattr(server, "MAX_PARALLEL_TRIGGERS", 1)
+    requests = mock_http(lambda request: httpx.Response(401))
+
+    results = asyncio.run(server.bb7_trigger_bulk.fn("integration", 5))
+
+    assert len(requests) == 1
+    assert len(results) == 1
+    assert results[0]["success"] is False
+    assert results[0]["suggestion"] == server.PAT_SUGGESTION